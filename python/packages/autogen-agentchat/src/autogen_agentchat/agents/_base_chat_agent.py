@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, List, Mapping, Sequence
+from asyncio import Future
+from contextlib import nullcontext
+from typing import Any, AsyncGenerator, Callable, ContextManager, List, Mapping, Sequence, Tuple
 
 from autogen_core import CancellationToken, ComponentBase, trace_create_agent_span, trace_invoke_agent_span
+from opentelemetry.trace import NoOpTracerProvider, ProxyTracerProvider, get_tracer_provider
 from pydantic import BaseModel
 
 from ..base import ChatAgent, Response, TaskResult
@@ -13,6 +16,71 @@
 )
 from ..state import BaseState
 
+# The default state is always the same, so serialize it once at import time.
+_EMPTY_BASE_STATE: Mapping[str, Any] = BaseState().model_dump()
+
+
+def _tracing_enabled() -> bool:
+    """Whether a tracer provider has been installed. Checked per call because
+    applications commonly configure OpenTelemetry after importing autogen."""
+    return not isinstance(get_tracer_provider(), (ProxyTracerProvider, NoOpTracerProvider))
+
+
+def _create_agent_span(agent_name: str, agent_description: str) -> ContextManager[Any]:
+    if not _tracing_enabled():
+        return nullcontext()
+    return trace_create_agent_span(agent_name=agent_name, agent_description=agent_description)
+
+
+def _invoke_agent_span(agent_name: str, agent_description: str) -> ContextManager[Any]:
+    if not _tracing_enabled():
+        return nullcontext()
+    return trace_invoke_agent_span(agent_name=agent_name, agent_description=agent_description)
+
+
+class _NeverCancelledToken(CancellationToken):
+    """Token shared by all runs whose caller did not pass one. Since no caller
+    can cancel it, it ignores cancellation and does not retain callbacks,
+    which would otherwise accumulate across runs."""
+
+    def cancel(self) -> None:
+        pass
+
+    def is_cancelled(self) -> bool:
+        return False
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        pass
+
+    def link_future(self, future: Future[Any]) -> Future[Any]:
+        return future
+
+
+_NEVER_CANCELLED = _NeverCancelledToken()
+
+
+def _normalize_task(
+    task: str | BaseChatMessage | Sequence[BaseChatMessage] | None,
+    output_task_messages: bool,
+) -> Tuple[List[BaseChatMessage], Sequence[BaseChatMessage]]:
+    """Convert a task into the messages passed to the agent and the task
+    messages to include in the output."""
+    if task is None:
+        return [], ()
+    if isinstance(task, str):
+        input_messages: List[BaseChatMessage] = [TextMessage(content=task, source="user")]
+    elif isinstance(task, BaseChatMessage):
+        input_messages = [task]
+    else:
+        if not task:
+            raise ValueError("Task list cannot be empty.")
+        # Task is a sequence of messages.
+        input_messages = list(task)
+        for msg in input_messages:
+            if not isinstance(msg, BaseChatMessage):
+                raise ValueError(f"Invalid message type in sequence: {type(msg)}")
+    return input_messages, input_messages if output_task_messages else ()
+
 
 class BaseChatAgent(ChatAgent, ABC, ComponentBase[BaseModel]):
     """Base class for a chat agent.
@@ -40,13 +108,10 @@ class BaseChatAgent(ChatAgent, ABC, ComponentBase[BaseModel]):
 
     def __init__(self, name: str, description: str) -> None:
         """Initialize the agent with a name and description."""
-        with trace_create_agent_span(
-            agent_name=name,
-            agent_description=description,
-        ):
+        if not name.isidentifier():
+            raise ValueError("The agent name must be a valid Python identifier.")
+        with _create_agent_span(name, description):
             self._name = name
-            if self._name.isidentifier() is False:
-                raise ValueError("The agent name must be a valid Python identifier.")
             self._description = description
 
     @property
@@ -104,8 +169,9 @@ async def on_messages_stream(
 
         """
         response = await self.on_messages(messages, cancellation_token)
-        for inner_message in response.inner_messages or []:
-            yield inner_message
+        if response.inner_messages:
+            for inner_message in response.inner_messages:
+                yield inner_message
         yield response
 
     async def run(
@@ -116,39 +182,14 @@ async def run(
         output_task_messages: bool = True,
     ) -> TaskResult:
         """Run the agent with the given task and return the result."""
-        with trace_invoke_agent_span(
-            agent_name=self.name,
-            agent_description=self.description,
-        ):
+        with _invoke_agent_span(self._name, self._description):
             if cancellation_token is None:
-                cancellation_token = CancellationToken()
-            input_messages: List[BaseChatMessage] = []
-            output_messages: List[BaseAgentEvent | BaseChatMessage] = []
-            if task is None:
-                pass
-            elif isinstance(task, str):
-                text_msg = TextMessage(content=task, source="user")
-                input_messages.append(text_msg)
-                if output_task_messages:
-                    output_messages.append(text_msg)
-            elif isinstance(task, BaseChatMessage):
-                input_messages.append(task)
-                if output_task_messages:
-                    output_messages.append(task)
-            else:
-                if not task:
-                    raise ValueError("Task list cannot be empty.")
-                # Task is a sequence of messages.
-                for msg in task:
-                    if isinstance(msg, BaseChatMessage):
-                        input_messages.append(msg)
-                        if output_task_messages:
-                            output_messages.append(msg)
-                    else:
-                        raise ValueError(f"Invalid message type in sequence: {type(msg)}")
+                cancellation_token = _NEVER_CANCELLED
+            input_messages, task_messages = _normalize_task(task, output_task_messages)
+            output_messages: List[BaseAgentEvent | BaseChatMessage] = list(task_messages)
             response = await self.on_messages(input_messages, cancellation_token)
-            if response.inner_messages is not None:
-                output_messages += response.inner_messages
+            if response.inner_messages:
+                output_messages.extend(response.inner_messages)
             output_messages.append(response.chat_message)
             return TaskResult(messages=output_messages)
 
@@ -161,44 +202,20 @@ async def run_stream(
     ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
         """Run the agent with the given task and return a stream of messages
         and the final task result as the last item in the stream.
+        Use :meth:`run` instead if only the final :class:`TaskResult` is needed.
 
         Args:
             task: The task to run. Can be a string, a single message, or a sequence of messages.
             cancellation_token: The cancellation token to kill the task immediately.
             output_task_messages: Whether to include task messages in the output stream. Defaults to True for backward compatibility.
         """
-        with trace_invoke_agent_span(
-            agent_name=self.name,
-            agent_description=self.description,
-        ):
+        with _invoke_agent_span(self._name, self._description):
             if cancellation_token is None:
-                cancellation_token = CancellationToken()
-            input_messages: List[BaseChatMessage] = []
-            output_messages: List[BaseAgentEvent | BaseChatMessage] = []
-            if task is None:
-                pass
-            elif isinstance(task, str):
-                text_msg = TextMessage(content=task, source="user")
-                input_messages.append(text_msg)
-                if output_task_messages:
-                    output_messages.append(text_msg)
-                    yield text_msg
-            elif isinstance(task, BaseChatMessage):
-                input_messages.append(task)
-                if output_task_messages:
-                    output_messages.append(task)
-                    yield task
-            else:
-                if not task:
-                    raise ValueError("Task list cannot be empty.")
-                for msg in task:
-                    if isinstance(msg, BaseChatMessage):
-                        input_messages.append(msg)
-                        if output_task_messages:
-                            output_messages.append(msg)
-                            yield msg
-                    else:
-                        raise ValueError(f"Invalid message type in sequence: {type(msg)}")
+                cancellation_token = _NEVER_CANCELLED
+            input_messages, task_messages = _normalize_task(task, output_task_messages)
+            output_messages: List[BaseAgentEvent | BaseChatMessage] = list(task_messages)
+            for msg in task_messages:
+                yield msg
             async for message in self.on_messages_stream(input_messages, cancellation_token):
                 if isinstance(message, Response):
                     yield message.chat_message
@@ -232,11 +249,12 @@ async def on_resume(self, cancellation_token: CancellationToken) -> None:
 
     async def save_state(self) -> Mapping[str, Any]:
         """Export state. Default implementation for stateless agents."""
-        return BaseState().model_dump()
+        return dict(_EMPTY_BASE_STATE)
 
     async def load_state(self, state: Mapping[str, Any]) -> None:
         """Restore agent from saved state. Default implementation for stateless agents."""
-        BaseState.model_validate(state)
+        if not isinstance(state, Mapping) or state:
+            BaseState.model_validate(state)
 
     async def close(self) -> None:
         """Release any resources held by the agent. This is a no-op by default in the
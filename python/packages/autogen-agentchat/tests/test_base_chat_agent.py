@@ -0,0 +1,157 @@
+import asyncio
+from enum import Enum
+from typing import Sequence
+
+import pytest
+from autogen_agentchat.agents import BaseChatAgent, _base_chat_agent  # type: ignore[reportPrivateUsage]
+from autogen_agentchat.base import Response, TaskResult
+from autogen_agentchat.messages import BaseChatMessage, TextMessage
+from autogen_core import CancellationToken
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import ProxyTracerProvider, get_tracer_provider
+
+
+class _EchoAgent(BaseChatAgent):
+    @property
+    def produced_message_types(self) -> Sequence[type[BaseChatMessage]]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        content = messages[-1].to_text() if messages else ""
+        return Response(chat_message=TextMessage(content=content, source=self.name))
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_default_save_and_load_state() -> None:
+    agent = _EchoAgent("echo", "An echo agent.")
+    state = await agent.save_state()
+    assert state == {"type": "BaseState", "version": "1.0.0"}
+
+    # Mutating the returned state must not leak into later calls.
+    state["version"] = "2.0.0"  # type: ignore[index]
+    assert (await agent.save_state())["version"] == "1.0.0"
+
+    await agent.load_state({})
+    await agent.load_state(state)
+    with pytest.raises(ValueError):
+        await agent.load_state({"version": 1})
+    with pytest.raises(ValueError):
+        await agent.load_state(None)  # type: ignore[arg-type]
+
+
+def test_agent_name_must_be_identifier() -> None:
+    _EchoAgent("echo_1", "An echo agent.")
+    with pytest.raises(ValueError, match="valid Python identifier"):
+        _EchoAgent("echo-1", "An echo agent.")
+
+
+@pytest.mark.asyncio
+async def test_run_task_types() -> None:
+    agent = _EchoAgent("echo", "An echo agent.")
+
+    result = await agent.run()
+    assert [m.to_text() for m in result.messages] == [""]
+
+    result = await agent.run(task="hello")
+    assert [m.to_text() for m in result.messages] == ["hello", "hello"]
+
+    result = await agent.run(task=TextMessage(content="hi", source="user"), output_task_messages=False)
+    assert [m.to_text() for m in result.messages] == ["hi"]
+
+    task = [TextMessage(content="a", source="user"), TextMessage(content="b", source="user")]
+    result = await agent.run(task=task)
+    assert [m.to_text() for m in result.messages] == ["a", "b", "b"]
+    streamed = [m async for m in agent.run_stream(task=task)]
+    assert [m.to_text() for m in streamed[:-1]] == ["a", "b", "b"]  # type: ignore[union-attr]
+    assert isinstance(streamed[-1], TaskResult)
+    assert streamed[-1].messages[:-1] == result.messages[:-1]
+
+    with pytest.raises(ValueError, match="cannot be empty"):
+        await agent.run(task=[])
+    with pytest.raises(ValueError, match="Invalid message type"):
+        await agent.run(task=[TextMessage(content="a", source="user"), "b"])  # type: ignore[list-item]
+
+
+class _Prompt(str, Enum):
+    GREETING = "hello"
+
+
+@pytest.mark.asyncio
+async def test_run_accepts_str_subclass_task() -> None:
+    agent = _EchoAgent("echo", "An echo agent.")
+    result = await agent.run(task=_Prompt.GREETING)
+    assert [m.to_text() for m in result.messages] == ["hello", "hello"]
+
+
+@pytest.mark.asyncio
+async def test_run_without_cancellation_token() -> None:
+    tokens: list[CancellationToken] = []
+
+    class _TokenAgent(_EchoAgent):
+        async def on_messages(
+            self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken
+        ) -> Response:
+            tokens.append(cancellation_token)
+            return await super().on_messages(messages, cancellation_token)
+
+    agent = _TokenAgent("echo", "An echo agent.")
+    await agent.run(task="hello")
+    async for _ in agent.run_stream(task="hello"):
+        pass
+    assert len(tokens) == 2
+
+    # The default token cannot be cancelled, and does not cancel linked futures.
+    default_token = tokens[0]
+    future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    default_token.link_future(future)
+    default_token.cancel()
+    assert not default_token.is_cancelled()
+    assert not future.cancelled()
+    future.set_result(None)
+
+    token = CancellationToken()
+    await agent.run(task="hello", cancellation_token=token)
+    assert tokens[-1] is token
+
+
+@pytest.mark.asyncio
+async def test_agent_spans_with_tracer_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    # Patch the module's lookup rather than calling the one-shot set_tracer_provider.
+    monkeypatch.setattr(_base_chat_agent, "get_tracer_provider", lambda: tracer_provider)
+    # The span helpers resolve their tracer through the global provider.
+    monkeypatch.setattr("opentelemetry.trace.get_tracer_provider", lambda: tracer_provider)
+
+    agent = _EchoAgent("echo", "An echo agent.")
+    assert [span.name for span in exporter.get_finished_spans()] == ["create_agent echo"]
+
+    exporter.clear()
+    await agent.run(task="hello")
+    assert [span.name for span in exporter.get_finished_spans()] == ["invoke_agent echo"]
+
+    exporter.clear()
+    async for _ in agent.run_stream(task="hello"):
+        pass
+    assert [span.name for span in exporter.get_finished_spans()] == ["invoke_agent echo"]
+
+
+@pytest.mark.asyncio
+async def test_agent_spans_without_tracer_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _create_span(*args: object, **kwargs: object) -> None:
+        raise AssertionError("No span should be created without a tracer provider.")
+
+    assert isinstance(get_tracer_provider(), ProxyTracerProvider)
+    monkeypatch.setattr(_base_chat_agent, "trace_create_agent_span", _create_span)
+    monkeypatch.setattr(_base_chat_agent, "trace_invoke_agent_span", _create_span)
+
+    agent = _EchoAgent("echo", "An echo agent.")
+    await agent.run(task="hello")
+    async for _ in agent.run_stream(task="hello"):
+        pass